@@ -27,6 +27,15 @@ class Settings(BaseSettings):
     LANGFUSE_PUBLIC_KEY: str
     LANGFUSE_SECRET_KEY: str
     LANGFUSE_HOST: str = "https://cloud.langfuse.com"
+    # Tracing export (batched in a background thread, spans are dropped once the queue is full)
+    LANGFUSE_FLUSH_AT: int = 64
+    LANGFUSE_FLUSH_INTERVAL: float = 5.0
+    LANGFUSE_MAX_QUEUE_SIZE: int = 2048
+    LANGFUSE_TIMEOUT: int = 5  # Seconds per export request
+    LANGFUSE_SHUTDOWN_TIMEOUT: float = 5.0
+
+    # Seconds uvicorn waits for in-flight requests on shutdown before cancelling them
+    SHUTDOWN_DRAIN_TIMEOUT: int = 90
 
     # Data Directory
     DATA_DIR: Path = Path("data")
@@ -34,6 +43,12 @@ class Settings(BaseSettings):
     PUBLIC_DIR: Path = DATA_DIR / "public"
     # Directory for generated HTML decks
     GENERATED_DIR: Path = PUBLIC_DIR / "generated"
+    # Directory for the precomputed candidate profile
+    CACHE_DIR: Path = DATA_DIR / "cache"
+    # Seconds between checks of the candidate directory for changes
+    PROFILE_REFRESH_INTERVAL: float = 60.0
+    # Upper bound for the backoff between failed profile extractions
+    PROFILE_RETRY_MAX_BACKOFF: float = 3600.0
 
     # CORS Configuration
     BACKEND_CORS_ORIGINS: str = "http://localhost:3000,http://localhost:8000"
@@ -62,9 +77,14 @@ class Settings(BaseSettings):
         # Set environment variables
         os.environ["USER_AGENT"] = f"pytchdeck/{self.VERSION}"  # Ell user agent
         os.environ["LANGFUSE_TRACING_ENVIRONMENT"] = self.ENV  # Langfuse env
+        os.environ["LANGFUSE_FLUSH_AT"] = str(self.LANGFUSE_FLUSH_AT)  # Langfuse batch size
+        os.environ["LANGFUSE_FLUSH_INTERVAL"] = str(self.LANGFUSE_FLUSH_INTERVAL)
+        os.environ["LANGFUSE_TIMEOUT"] = str(self.LANGFUSE_TIMEOUT)  # Langfuse export timeout
+        os.environ["OTEL_BSP_MAX_QUEUE_SIZE"] = str(self.LANGFUSE_MAX_QUEUE_SIZE)  # Span queue bound
         # Ensure required directories exist
         self.PUBLIC_DIR.mkdir(parents=True, exist_ok=True)
         self.GENERATED_DIR.mkdir(parents=True, exist_ok=True)
+        self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 @lru_cache
 def settings() -> Settings:
@@ -1,7 +1,10 @@
 """Setup FastAPI application."""
 
+import asyncio
+import contextlib
 import logging
 import os
+import threading
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -13,7 +16,12 @@ from llama_index.core import Document
 
 from pytchdeck.clients.llm import llm
 from pytchdeck.config.settings import settings
-from pytchdeck.models.exceptions import InitializationError
+from pytchdeck.models.exceptions import InitializationError, StructureParsingError
+from pytchdeck.workflows.nodes.profile import (
+    candidate_fingerprint,
+    load_or_extract_profile,
+    load_profile,
+)
 from pytchdeck.workflows.nodes.readers import read_files
 
 config = settings()
@@ -35,10 +43,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     )
     await setup_directories()  # Setup required directories
     await setup_candidate_context(app)  # Ingest candidate context
+    await setup_candidate_profile(app)  # Load cached profile, keep it fresh in the background
     logger.info("Started FastAPI application")
     yield
     # Shutdown events
-    langfuse.shutdown()
+    app.state.profile_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await app.state.profile_task
+    await flush_traces()
     logger.info("Shut down complete")
 
 
@@ -65,3 +77,70 @@ async def ingest_candidate_context() -> str:
         raise InitializationError("Candidate directory not setup or empty.")
     docs: list[Document] = await read_files(path)
     return "\n".join([doc.text for doc in docs])
+
+
+async def setup_candidate_profile(app: FastAPI):
+    """Load the cached candidate profile and start the background refresh task."""
+    fingerprint = await asyncio.to_thread(candidate_fingerprint, config.CANDIDATE_DIR)
+    app.state.candidate_fingerprint = fingerprint
+    app.state.profile_failed_fingerprint = None
+    app.state.candidate_profile = await asyncio.to_thread(load_profile, fingerprint)
+    if app.state.candidate_profile:
+        logger.info("Loaded cached candidate profile")
+    app.state.profile_task = asyncio.create_task(refresh_candidate_profile(app))
+
+
+async def refresh_candidate_profile(app: FastAPI):
+    """Recompute the candidate profile whenever the candidate files change.
+
+    Until a profile is available, requests fall back to the raw candidate context.
+    Transient failures are retried with exponential backoff; an unparseable model response is
+    not retried until the candidate files change again.
+    """
+    loop = asyncio.get_running_loop()
+    failures: int = 0
+    retry_at: float = 0.0
+    while True:
+        try:
+            fingerprint = await asyncio.to_thread(candidate_fingerprint, config.CANDIDATE_DIR)
+            if fingerprint != app.state.candidate_fingerprint:
+                logger.info("Candidate files changed, reloading candidate context")
+                app.state.candidate_profile = None  # Invalidate before swapping the context
+                app.state.candidate_context = await ingest_candidate_context()
+                app.state.candidate_fingerprint = fingerprint
+                failures, retry_at = 0, 0.0
+            if (
+                app.state.candidate_profile is None
+                and app.state.profile_failed_fingerprint != fingerprint
+                and loop.time() >= retry_at
+            ):
+                app.state.candidate_profile = await asyncio.to_thread(
+                    load_or_extract_profile, fingerprint, app.state.candidate_context
+                )
+                failures = 0
+                logger.info("Candidate profile ready")
+        except StructureParsingError:
+            app.state.profile_failed_fingerprint = fingerprint
+            logger.exception("Unparseable candidate profile, not retrying until the files change")
+        except Exception:
+            failures += 1
+            backoff = min(
+                config.PROFILE_REFRESH_INTERVAL * 2**failures, config.PROFILE_RETRY_MAX_BACKOFF
+            )
+            retry_at = loop.time() + backoff
+            logger.exception("Failed to refresh candidate profile, retrying in %.0fs", backoff)
+        await asyncio.sleep(config.PROFILE_REFRESH_INTERVAL)
+
+
+async def flush_traces():
+    """Flush pending traces in a daemon thread, waiting at most the configured timeout.
+
+    The daemon thread is abandoned on timeout, so a stuck export cannot block process exit.
+    """
+    flusher = threading.Thread(target=langfuse.shutdown, name="langfuse-flush", daemon=True)
+    flusher.start()
+    await asyncio.to_thread(flusher.join, config.LANGFUSE_SHUTDOWN_TIMEOUT)
+    if flusher.is_alive():
+        logger.warning(
+            "Trace flush still running after %ss, abandoning it", config.LANGFUSE_SHUTDOWN_TIMEOUT
+        )
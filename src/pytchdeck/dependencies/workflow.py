@@ -53,3 +53,10 @@ async def candidate_context(request: Request) -> str:
     return request.app.state.candidate_context
 
 CandidateContext = Annotated[str, Depends(candidate_context)]
+
+async def candidate_profile(request: Request) -> str | None:
+    """Get the precomputed candidate profile from FastAPI state, if it is ready."""
+    profile = request.app.state.candidate_profile
+    return profile.model_dump_json(exclude_defaults=True) if profile else None
+
+CandidateProfileJson = Annotated[str | None, Depends(candidate_profile)]
@@ -13,6 +13,7 @@ class State(BaseModel):
     jd: str | None = Field(None, description="Job description")
     jd_link: str | None = Field(None, description="Job description link")
     candidate_context: str = Field(..., description="Candidate context")
+    candidate_profile: str | None = Field(None, description="Precomputed candidate profile")
 
 
 class IsValidJD(BaseModel):
@@ -28,3 +29,16 @@ class PitchGenerationResult(BaseModel):
     link: str | None = Field(None, description="Link to the generated pitch deck")
     title: str | None = Field(None, description="Title of the generated pitch deck")
     message: str | None = Field(None, description="Message accompanying the generated pitch deck")
+
+
+class CandidateProfile(BaseModel):
+    """Compact, structured summary of the candidate's context."""
+
+    name: str | None = Field(None, description="Candidate's full name")
+    headline: str = Field(description="One line summary of the candidate")
+    seniority: str = Field(description="Seniority level and years of experience")
+    skills: list[str] = Field(default_factory=list, description="Technical and professional skills")
+    domains: list[str] = Field(default_factory=list, description="Industries and domains worked in")
+    highlight_projects: list[str] = Field(
+        default_factory=list, description="Most notable projects and achievements, one line each"
+    )
@@ -3,7 +3,7 @@
 from fastapi import APIRouter, HTTPException, Request, status
 
 import pytchdeck.workflows.pitch as workflow
-from pytchdeck.dependencies.workflow import CandidateContext, WorkflowConfig
+from pytchdeck.dependencies.workflow import CandidateContext, CandidateProfileJson, WorkflowConfig
 from pytchdeck.models.dto import PitchOutput, PitchRequest
 from pytchdeck.models.exceptions import (
     InvalidJobDescriptionError,
@@ -28,7 +28,11 @@ router = APIRouter(prefix="/api/v1", tags=["pitch"])
     response_description="The generated pitch deck details",
 )
 async def pitch(
-    request: Request, body: PitchRequest, config: WorkflowConfig, context: CandidateContext
+    request: Request,
+    body: PitchRequest,
+    config: WorkflowConfig,
+    context: CandidateContext,
+    profile: CandidateProfileJson,
 ) -> PitchOutput:
     """Generate a pitch deck for a given job description."""
     if not body.job_description and not body.job_description_link:
@@ -37,7 +41,9 @@ async def pitch(
             detail="At least one of job_description or job_description_link must be provided",
         )
     try:
-        return await workflow.run(req=body, config=config, candidate_context=context)
+        return await workflow.run(
+            req=body, config=config, candidate_context=context, candidate_profile=profile
+        )
     except (InvalidJobDescriptionError, NoContentError, InvalidUrlSchemeError, StructureParsingError) as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -0,0 +1,68 @@
+"""Gunicorn worker."""
+
+import asyncio
+import sys
+
+from gunicorn.arbiter import Arbiter
+from uvicorn.workers import UvicornWorker as BaseUvicornWorker
+
+from pytchdeck.config.settings import settings
+from pytchdeck.models.exceptions import InitializationError
+
+
+def check_graceful_timeout(graceful_timeout: float, shutdown_timeout: float) -> None:
+    """Ensure gunicorn does not kill a worker before its shutdown deadline has passed.
+
+    Raises
+    ------
+    InitializationError
+        If `graceful_timeout` does not exceed `shutdown_timeout`.
+    """
+    if graceful_timeout <= shutdown_timeout:
+        raise InitializationError(
+            f"Gunicorn --graceful-timeout ({graceful_timeout}s) must exceed the worker shutdown "
+            f"deadline ({shutdown_timeout}s), raise it or lower SHUTDOWN_DRAIN_TIMEOUT"
+        )
+
+
+def shutdown_timeout() -> float:
+    """Return the longest a worker may take to shut down: request draining plus trace flush."""
+    return settings().SHUTDOWN_DRAIN_TIMEOUT + settings().LANGFUSE_SHUTDOWN_TIMEOUT
+
+
+class UvicornWorker(BaseUvicornWorker):
+    """Uvicorn worker that drains in-flight requests on shutdown.
+
+    On SIGTERM uvicorn stops accepting connections, then waits up to
+    `SHUTDOWN_DRAIN_TIMEOUT` seconds for running requests before cancelling them.
+    Gunicorn's `--graceful-timeout` must exceed this deadline, which is checked at startup.
+    """
+
+    CONFIG_KWARGS = {  # noqa: RUF012
+        **BaseUvicornWorker.CONFIG_KWARGS,
+        "timeout_graceful_shutdown": settings().SHUTDOWN_DRAIN_TIMEOUT,
+    }
+
+    def init_process(self) -> None:
+        """Refuse to boot if gunicorn would kill the worker before draining completes."""
+        try:
+            check_graceful_timeout(self.cfg.graceful_timeout, shutdown_timeout())
+        except InitializationError as e:
+            self.log.error(str(e))
+            sys.exit(Arbiter.WORKER_BOOT_ERROR)
+        super().init_process()
+
+    async def _serve(self) -> None:
+        # uvicorn only heartbeats from its main loop, which stops while draining requests,
+        # so the arbiter would otherwise time the worker out mid-drain on reloads and recycles
+        heartbeat = asyncio.create_task(self._heartbeat())
+        try:
+            await super()._serve()
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self) -> None:
+        """Notify the arbiter that the worker is alive for as long as the event loop runs."""
+        while True:
+            self.notify()
+            await asyncio.sleep(self.timeout or 1)
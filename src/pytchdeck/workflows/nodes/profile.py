@@ -0,0 +1,98 @@
+"""Candidate profile precomputation and on-disk cache."""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+import ell
+from pydantic import ValidationError
+
+from pytchdeck.clients.llm import llm
+from pytchdeck.config.settings import settings
+from pytchdeck.models.exceptions import StructureParsingError
+from pytchdeck.models.states import CandidateProfile
+from pytchdeck.workflows.nodes.writers import write_text_atomic
+
+logger = logging.getLogger(__name__)
+
+PROFILE_CACHE_FILE: str = "candidate_profile.json"
+PROFILE_LOCK_FILE: str = "candidate_profile.lock"
+
+
+def candidate_fingerprint(path: Path) -> str:
+    """Hash the names and contents of the candidate files into a version identifier."""
+    digest = hashlib.sha256()
+    for file_name in sorted(os.listdir(path)):
+        file_path = path / file_name
+        if not file_path.is_file():
+            continue
+        digest.update(file_name.encode())
+        digest.update(file_path.read_bytes())
+    return digest.hexdigest()
+
+
+def load_profile(fingerprint: str) -> CandidateProfile | None:
+    """Load the cached profile if it was computed for the given fingerprint."""
+    cache_path: Path = settings().CACHE_DIR / PROFILE_CACHE_FILE
+    if not cache_path.exists():
+        return None
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        if cached.get("fingerprint") != fingerprint:
+            return None
+        return CandidateProfile.model_validate(cached["profile"])
+    except (OSError, ValueError, KeyError, AttributeError) as e:
+        logger.warning("Discarding unreadable candidate profile cache: %s", e)
+        return None
+
+
+def save_profile(fingerprint: str, profile: CandidateProfile) -> None:
+    """Persist the profile alongside the fingerprint it was computed for."""
+    cache_path: Path = settings().CACHE_DIR / PROFILE_CACHE_FILE
+    payload = {"fingerprint": fingerprint, "profile": profile.model_dump(mode="json")}
+    write_text_atomic(cache_path, json.dumps(payload))
+
+
+def load_or_extract_profile(fingerprint: str, candidate_context: str) -> CandidateProfile:
+    """Load the cached profile, extracting and caching it if missing.
+
+    Extraction runs under a file lock so that only one worker process calls the model per
+    candidate-context version; the others wait and then read the cached result.
+    """
+    lock_path: Path = settings().CACHE_DIR / PROFILE_LOCK_FILE
+    with lock_path.open("w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)  # Released when the file is closed
+        profile = load_profile(fingerprint)
+        if profile is None:
+            profile = extract_profile(candidate_context)
+            save_profile(fingerprint, profile)
+        return profile
+
+
+def extract_profile(candidate_context: str) -> CandidateProfile:
+    """Condense the raw candidate context into a structured profile."""
+    logger.info("Extracting candidate profile")
+    result = summarize_candidate(candidate_context)
+    try:
+        return CandidateProfile.model_validate_json(result)
+    except ValidationError as e:
+        raise StructureParsingError("Error parsing candidate profile response") from e
+
+
+@ell.simple(model="gpt-4.1-mini", temperature=0.0, client=llm())
+def summarize_candidate(candidate_context: str) -> str:
+    """Use a language model to extract a compact profile from the candidate context."""
+    return [
+        ell.system(f"""
+            Extract a compact profile of the candidate from the provided documents.
+            Keep every entry short and factual, and do not invent information.
+            The response should be a JSON object matching the following schema.
+            You must absolutely respond in this format with no exceptions.
+
+            {CandidateProfile.model_json_schema()}
+            """),
+        ell.user(f"\n <Candidate Context> \n\n{candidate_context} \n\n </Candidate Context>"),
+    ]
@@ -0,0 +1,17 @@
+"""Writers/ File persistence."""
+
+import os
+import tempfile
+from pathlib import Path
+
+
+def write_text_atomic(path: Path, content: str) -> None:
+    """Write text to a file so readers only ever see the old or the complete new content."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -1,7 +1,6 @@
 """Pitch Deck Creation Workflow."""
 
 import logging
-from pathlib import Path
 
 # Standard library
 # Third-party
@@ -22,6 +21,7 @@ from pytchdeck.models.exceptions import InvalidJobDescriptionError
 from pytchdeck.models.states import IsValidJD, PitchGenerationResult, State
 from pytchdeck.workflows.nodes.guardrails import jd_guardrails
 from pytchdeck.workflows.nodes.readers import fetch_content
+from pytchdeck.workflows.nodes.writers import write_text_atomic
 
 logger = logging.getLogger(__name__)
 config = settings()
@@ -33,13 +33,16 @@ LLMS_TXT = (
 )
 
 
-async def run(req: PitchRequest, config: dict, candidate_context: str) -> PitchOutput:
+async def run(
+    req: PitchRequest, config: dict, candidate_context: str, candidate_profile: str | None = None
+) -> PitchOutput:
     """Create a pitch deck for a given job description."""
     state = State(
         id=config["configurable"]["thread_id"],
         jd=req.job_description,
         jd_link=req.job_description_link.unicode_string() if req.job_description_link else None,
         candidate_context=candidate_context,
+        candidate_profile=candidate_profile,
         host=config["configurable"].get("host", ""),
     )
     result: PitchGenerationResult = await pitch_workflow.ainvoke(state, config)
@@ -54,10 +57,15 @@ async def pitch_workflow(state: State) -> PitchGenerationResult:
     guardrails: IsValidJD = await jd_guardrails(jd)
     if not guardrails.is_valid:
         raise InvalidJobDescriptionError(f"{guardrails.reason or 'No reason provided'}")
-    fit_assessment: str = await assess_fit(jd=jd, candidate_context=state.candidate_context)
-    deck_content: str = await generate_deck(context=f"{fit_assessment}\n\n{state.candidate_context}")
+    # Assess fit against the compact precomputed profile, the deck still gets the full documents
+    fit_assessment: str = await assess_fit(
+        jd=jd, candidate_context=state.candidate_profile or state.candidate_context
+    )
+    deck_content: str = await generate_deck(
+        context=f"{fit_assessment}\n\n{state.candidate_context}"
+    )
     output_path = settings().GENERATED_DIR / f"pitch_{state.id}.html"  # Save generated HTML to file
-    Path(output_path).write_text(deck_content, encoding="utf-8")
+    write_text_atomic(output_path, deck_content)
     return PitchGenerationResult(
         link=f"{state.host}/pitch/pitch_{state.id}.html",
         title="Pitch Deck",
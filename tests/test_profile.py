@@ -0,0 +1,72 @@
+"""Test candidate profile fingerprinting and caching."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pytchdeck.models.states import CandidateProfile
+from pytchdeck.workflows.nodes import profile as profile_node
+
+PROFILE = CandidateProfile(
+    name="Jane Doe",
+    headline="Backend engineer",
+    seniority="Senior, 8 years",
+    skills=["Python", "FastAPI"],
+    domains=["Fintech"],
+    highlight_projects=["Payments platform"],
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the profile cache at a temporary directory."""
+    monkeypatch.setattr(profile_node, "settings", lambda: SimpleNamespace(CACHE_DIR=tmp_path))
+    return tmp_path
+
+
+def test_fingerprint_changes_with_file_contents(tmp_path: Path) -> None:
+    """Test that editing a candidate file changes the fingerprint."""
+    (tmp_path / "resume.md").write_text("Python developer", encoding="utf-8")
+    before = profile_node.candidate_fingerprint(tmp_path)
+    assert profile_node.candidate_fingerprint(tmp_path) == before
+    (tmp_path / "resume.md").write_text("Rust developer", encoding="utf-8")
+    assert profile_node.candidate_fingerprint(tmp_path) != before
+
+
+def test_save_then_load_round_trips(cache_dir: Path) -> None:
+    """Test that a saved profile is loaded back unchanged."""
+    profile_node.save_profile("abc", PROFILE)
+    assert profile_node.load_profile("abc") == PROFILE
+
+
+def test_load_ignores_mismatched_fingerprint(cache_dir: Path) -> None:
+    """Test that a profile cached for other candidate files is ignored."""
+    profile_node.save_profile("abc", PROFILE)
+    assert profile_node.load_profile("def") is None
+
+
+@pytest.mark.parametrize("content", ["[]", "not json", '{"fingerprint": "abc"}'])
+def test_load_ignores_corrupt_cache(cache_dir: Path, content: str) -> None:
+    """Test that an unreadable cache file is discarded instead of raising."""
+    (cache_dir / profile_node.PROFILE_CACHE_FILE).write_text(content, encoding="utf-8")
+    assert profile_node.load_profile("abc") is None
+
+
+def test_concurrent_callers_extract_once(cache_dir: Path, mocker: MockerFixture) -> None:
+    """Test that workers racing on a cold cache call the model only once."""
+
+    def slow_extract(candidate_context: str) -> CandidateProfile:
+        time.sleep(0.2)
+        return PROFILE
+
+    extract = mocker.patch.object(profile_node, "extract_profile", side_effect=slow_extract)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(
+            pool.map(lambda _: profile_node.load_or_extract_profile("abc", "context"), range(2))
+        )
+    assert results == [PROFILE, PROFILE]
+    extract.assert_called_once_with("context")
@@ -0,0 +1,102 @@
+"""Test graceful shutdown of the gunicorn worker."""
+
+import asyncio
+import re
+import socket
+import tomllib
+from pathlib import Path
+from unittest.mock import Mock
+
+import httpx
+import pytest
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from pytchdeck.config.settings import settings
+from pytchdeck.models.exceptions import InitializationError
+from pytchdeck.worker import UvicornWorker, check_graceful_timeout, shutdown_timeout
+
+PYPROJECT = Path(__file__).parents[1] / "pyproject.toml"
+
+
+def free_port() -> int:
+    """Return a free local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_worker_sets_drain_deadline() -> None:
+    """Test that the worker bounds graceful shutdown by the configured deadline."""
+    assert UvicornWorker.CONFIG_KWARGS["timeout_graceful_shutdown"] == (
+        settings().SHUTDOWN_DRAIN_TIMEOUT
+    )
+
+
+def test_serve_graceful_timeout_exceeds_shutdown_deadline() -> None:
+    """Test that the served gunicorn graceful timeout outlasts the worker's shutdown deadline."""
+    serve = tomllib.loads(PYPROJECT.read_text(encoding="utf-8"))["tool"]["poe"]["tasks"]["serve"]
+    graceful_timeout = float(re.search(r"--graceful-timeout (\d+)", serve["shell"]).group(1))
+    check_graceful_timeout(graceful_timeout, shutdown_timeout())
+
+
+def test_check_graceful_timeout_rejects_short_timeout() -> None:
+    """Test that a graceful timeout within the shutdown deadline is rejected."""
+    with pytest.raises(InitializationError):
+        check_graceful_timeout(90, 95)
+
+
+def test_heartbeat_notifies_arbiter() -> None:
+    """Test that the worker keeps notifying the arbiter independently of uvicorn's main loop."""
+    worker = object.__new__(UvicornWorker)  # Skip gunicorn's constructor
+    worker.timeout = 0.01
+    worker.notify = Mock()
+
+    async def beat() -> None:
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(worker._heartbeat(), 0.1)
+
+    asyncio.run(beat())
+    assert worker.notify.call_count >= 2
+
+
+def test_shutdown_waits_for_in_flight_requests() -> None:
+    """Test that a request running when shutdown starts completes instead of being cut off."""
+
+    async def scenario() -> tuple[httpx.Response, bool]:
+        finished = asyncio.Event()
+
+        async def slow(request: Request) -> PlainTextResponse:
+            await asyncio.sleep(0.5)
+            finished.set()
+            return PlainTextResponse("done")
+
+        port = free_port()
+        server = uvicorn.Server(
+            uvicorn.Config(
+                Starlette(routes=[Route("/slow", slow)]),
+                host="127.0.0.1",
+                port=port,
+                lifespan="off",
+                log_level="warning",
+                **{**UvicornWorker.CONFIG_KWARGS, "timeout_graceful_shutdown": 2},
+            )
+        )
+        serving = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+        async with httpx.AsyncClient() as client:
+            request = asyncio.create_task(client.get(f"http://127.0.0.1:{port}/slow"))
+            await asyncio.sleep(0.1)  # Let the request reach the app before shutting down
+            server.should_exit = True
+            response = await request
+        await serving
+        return response, finished.is_set()
+
+    response, finished = asyncio.run(scenario())
+    assert finished
+    assert response.status_code == 200
+    assert response.text == "done"
@@ -0,0 +1,34 @@
+"""Test atomic file writers."""
+
+from pathlib import Path
+
+import pytest
+
+from pytchdeck.workflows.nodes import writers
+from pytchdeck.workflows.nodes.writers import write_text_atomic
+
+
+def test_write_replaces_target(tmp_path: Path) -> None:
+    """Test that the target is replaced and no temporary file is left behind."""
+    target = tmp_path / "pitch_1.html"
+    target.write_text("old", encoding="utf-8")
+    write_text_atomic(target, "new")
+    assert target.read_text(encoding="utf-8") == "new"
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_failed_write_keeps_target_and_cleans_up(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a failed replace leaves the old content and removes the temporary file."""
+    target = tmp_path / "pitch_1.html"
+    target.write_text("old", encoding="utf-8")
+
+    def fail_replace(src: str, dst: Path) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(writers.os, "replace", fail_replace)
+    with pytest.raises(OSError, match="disk full"):
+        write_text_atomic(target, "new")
+    assert target.read_text(encoding="utf-8") == "old"
+    assert list(tmp_path.iterdir()) == [target]